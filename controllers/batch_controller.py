@@ -0,0 +1,89 @@
+"""Controller for batch retrieval of multiple resources in one request.
+Handles:
+    - Get many resources by path (e.g. ["/events/1", "/events/2", "/organisers/3"])
+
+Note:
+    - Paths are grouped by resource so each resource type is loaded with a single
+      `WHERE id IN (...)` query instead of one query per path, with the same eager
+      loaders as its detail route so nested fields add a fixed number of queries.
+    - Results are returned in the same order as the requested paths, each with its
+      own status code, so one missing ID doesn't fail the whole batch.
+"""
+
+import re
+
+from flask import Blueprint, request
+from marshmallow import ValidationError
+
+from init import db
+from controllers.booking_controller import booking_loaders
+from controllers.event_controller import event_loaders
+from controllers.organiser_controller import organiser_loaders
+from controllers.show_controller import show_loaders
+from controllers.ticket_holder_controller import ticket_holder_loaders
+from controllers.venue_controller import venue_loaders
+from models.booking import Booking
+from models.event import Event
+from models.organiser import Organiser
+from models.show import Show
+from models.ticket_holder import TicketHolder
+from models.venue import Venue
+from schemas.booking_schema import booking_schema
+from schemas.event_schema import event_schema
+from schemas.organiser_schema import organiser_schema
+from schemas.show_schema import show_schema
+from schemas.ticket_holder_schema import ticket_holder_schema
+from schemas.venue_schema import venue_schema
+
+batch_bp = Blueprint("batch", __name__, url_prefix = "/batch")
+
+MAX_BATCH_SIZE = 50
+PATH_PATTERN = re.compile(r"^/(\w+)/(\d+)/?$")
+
+# Resource name -> (model, primary key column, schema, eager loaders, label for not found messages)
+RESOURCES = {
+    "bookings": (Booking, Booking.booking_id, booking_schema, booking_loaders, "Booking"),
+    "events": (Event, Event.event_id, event_schema, event_loaders, "Event"),
+    "organisers": (Organiser, Organiser.organiser_id, organiser_schema, organiser_loaders, "Organiser"),
+    "shows": (Show, Show.show_id, show_schema, show_loaders, "Show"),
+    "ticket_holders": (TicketHolder, TicketHolder.ticket_holder_id, ticket_holder_schema, ticket_holder_loaders, "Ticket holder"),
+    "venues": (Venue, Venue.venue_id, venue_schema, venue_loaders, "Venue"),
+}
+
+# ========= BATCH GET =========
+@batch_bp.route("/", methods = ["POST"])
+def get_batch():
+    """Retrieve multiple resources by path, one query per resource type."""
+    paths = request.get_json()
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        raise ValidationError({"paths": ["Request body must be a list of paths, e.g. [\"/events/1\", \"/organisers/3\"]."]})
+    if len(paths) > MAX_BATCH_SIZE:
+        raise ValidationError({"paths": [f"A batch can contain at most {MAX_BATCH_SIZE} paths."]})
+
+    requested = {} # resource -> set of IDs
+    parsed = []
+    for path in paths:
+        match = PATH_PATTERN.match(path)
+        if match and match.group(1) in RESOURCES:
+            resource, resource_id = match.group(1), int(match.group(2))
+            requested.setdefault(resource, set()).add(resource_id)
+            parsed.append((path, resource, resource_id))
+        else:
+            parsed.append((path, None, None))
+
+    found = {} # (resource, id) -> serialized object
+    for resource, ids in requested.items():
+        model, primary_key, schema, loaders, _ = RESOURCES[resource]
+        for obj in db.session.scalars(db.select(model).options(*loaders()).where(primary_key.in_(ids))):
+            found[(resource, getattr(obj, primary_key.key))] = schema.dump(obj)
+
+    results = []
+    for path, resource, resource_id in parsed:
+        if resource is None:
+            results.append({"path": path, "status": 404, "body": {"message": "Resource not found. Please check the URL."}})
+        elif (resource, resource_id) in found:
+            results.append({"path": path, "status": 200, "body": found[(resource, resource_id)]})
+        else:
+            label = RESOURCES[resource][4]
+            results.append({"path": path, "status": 404, "body": {"message": f"{label} with id {resource_id} doesn't exist."}})
+    return results, 200
\ No newline at end of file
@@ -3,6 +3,7 @@ Handles all CRUD operations/logic for bookings:
     - Get all bookings
     - Get one booking by ID
     - Create a new booking
+    - Create many bookings at once
     - Update an existing booking
     - Delete a booking
 
@@ -11,40 +12,94 @@ Note:
     - Pagination is implemented for retrieving all bookings, 10 bookings per page.
 """
 
+import math
+
 from flask import Blueprint, jsonify, request
+from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from marshmallow import ValidationError
 
-from init import db
+from init import db, cache
 from models.booking import Booking
+from models.show import Show
 from schemas.booking_schema import booking_schema, bookings_schema
+from utils.cache import cache_key_for, cached_count, invalidate
+from utils.integrity import commit_unique
+from utils.loaders import list_load_options
 
 bookings_bp = Blueprint("bookings", __name__, url_prefix = "/bookings")
 
+MAX_PER_PAGE = 100 # Caps rows fetched per request
+MAX_PAGE = 1000 # Caps OFFSET depth, use after_id for deeper pages
+MAX_BULK_BOOKINGS = 1000 # Caps rows per bulk create
+
+# Unique constraint on bookings -> validation error reported to the client
+UNIQUE_BOOKING_ERRORS = {
+    "booking_unique_ticket_holder_show": {"ticket_holder_id": ["This ticket holder already has a booking for this show."]},
+    "unique_seat_per_show": {"seat_number": ["This seat is already booked for this show."]}
+}
+
+def booking_loaders():
+    """Eager loaders for the relationships BookingSchema dumps (ticket_holder, show.event).
+    All many-to-one, so they are joined into the booking query rather than fetched separately.
+    """
+    return (
+        joinedload(Booking.ticket_holder),
+        joinedload(Booking.show).joinedload(Show.event)
+    )
+
+def commit_bookings():
+    """Commit booking writes, reporting duplicate bookings and taken seats as validation errors.
+    The unique constraints on bookings are the only check, so concurrent requests can't double-book.
+    """
+    commit_unique(UNIQUE_BOOKING_ERRORS)
+    invalidate("bookings")
+
 # ======== GET ALL BOOKINGS ========
 @bookings_bp.route("/", methods=["GET"])
+@cache.cached(timeout = 30, make_cache_key = cache_key_for("bookings")) # Short TTL, bookings churn
 def get_bookings():
-    """Retrieve all bookings with pagination."""
-    page = int(request.args.get("page", 1))
-    per_page = int(request.args.get("per_page", 10))
-    bookings_list = Booking.query.paginate(page=page, per_page=per_page, error_out=False)
-    data = bookings_schema.dump(bookings_list.items)
-    if not data:
+    """Retrieve all bookings with pagination.
+    Pass `after_id` for keyset pagination (seeks past the last booking_id seen,
+    no OFFSET scan or COUNT(*)), otherwise `page` is used.
+    """
+    per_page = max(1, min(request.args.get("per_page", 10, type = int), MAX_PER_PAGE)) # Invalid values fall back to defaults
+    loaders = list_load_options(*booking_loaders())
+    if "after_id" in request.args:
+        after_id = max(0, request.args.get("after_id", 0, type = int))
+        stmt = (db.select(Booking).options(*loaders)
+            .where(Booking.booking_id > after_id)
+            .order_by(Booking.booking_id)
+            .limit(per_page))
+        bookings_list = db.session.scalars(stmt).all()
+        if not bookings_list:
+            return {"message": "No bookings found. Please add a booking to get started."}, 200
+        return {
+            "bookings": bookings_schema.dump(bookings_list),
+            "per_page": per_page,
+            "next_cursor": bookings_list[-1].booking_id if len(bookings_list) == per_page else None
+        }, 200
+
+    page = max(1, min(request.args.get("page", 1, type = int), MAX_PAGE))
+    bookings_list = Booking.query.options(*loaders).order_by(Booking.booking_id).paginate(page=page, per_page=per_page, error_out=False, count=False) # Total comes from cached_count
+    if not bookings_list.items: # Skip the schema entirely on an empty page
         return {"message": "No bookings found. Please add a booking to get started."}, 200
+    total = cached_count("bookings", Booking.booking_id)
     return {
-        "bookings": data,
+        "bookings": bookings_schema.dump(bookings_list.items),
         "page": page,
         "per_page": per_page,
-        "total": bookings_list.total,
-        "pages": bookings_list.pages
+        "total": total,
+        "pages": math.ceil(total / per_page)
     }, 200
 
 # ========= GET ONE BOOKING ========
 @bookings_bp.route("/<int:booking_id>", methods = ["GET"])
+@cache.cached(timeout = 30, make_cache_key = cache_key_for("bookings"))
 def get_one_booking(booking_id):
     """Retrieve one booking by ID."""
-    stmt = db.select(Booking).where(Booking.booking_id == booking_id)
-    booking = db.session.scalar(stmt)
+    booking = db.session.get(Booking, booking_id, options = booking_loaders())
     data = booking_schema.dump(booking)
     if data:
         return jsonify(data), 200
@@ -61,15 +116,33 @@ def create_booking():
         session = db.session
     )
     db.session.add(new_booking)
-    db.session.commit()
+    commit_bookings()
     return booking_schema.dump(new_booking), 201
 
+# ========= CREATE MANY BOOKINGS =========
+@bookings_bp.route("/bulk", methods = ["POST"])
+def create_bookings_bulk():
+    """Create many bookings in one request, e.g. for a ticket drop.
+    All bookings are validated first, then inserted together in one transaction.
+    """
+    body_data = request.get_json()
+    if not isinstance(body_data, list) or not 1 <= len(body_data) <= MAX_BULK_BOOKINGS:
+        raise ValidationError({"bookings": [f"Request body must be a list of 1-{MAX_BULK_BOOKINGS} bookings."]})
+    new_bookings = bookings_schema.load(
+        body_data,
+        session = db.session
+    )
+    db.session.add_all(new_bookings)
+    commit_bookings() # Flushed as a batched multi-row INSERT, not one INSERT per booking
+    new_ids = [inspect(booking).identity[0] for booking in new_bookings] # Identity survives the commit's expiry, reading booking_id would refresh each row
+    stmt = db.select(Booking).options(*booking_loaders()).where(Booking.booking_id.in_(new_ids)).order_by(Booking.booking_id)
+    return jsonify(bookings_schema.dump(db.session.scalars(stmt))), 201
+
 # ========= UPDATE BOOKING =========
 @bookings_bp.route("/<int:booking_id>", methods = ["PUT", "PATCH"])
 def update_booking(booking_id):
     """Update an existing booking by ID."""
-    stmt = db.select(Booking).where(Booking.booking_id == booking_id)
-    booking = db.session.scalar(stmt)
+    booking = db.session.get(Booking, booking_id)
     if not booking:
         return {"message": f"Booking with id {booking_id} doesn't exist."}, 404
     else:
@@ -80,7 +153,7 @@ def update_booking(booking_id):
                 session = db.session,
                 partial = True
             )
-            db.session.commit()
+            commit_bookings()
             return booking_schema.dump(update_booking), 200
         except ValidationError as err:
             return jsonify(err.messages), 400
@@ -92,11 +165,10 @@ def update_booking(booking_id):
 @bookings_bp.route("/<int:booking_id>", methods = ["DELETE"])
 def delete_booking(booking_id):
     """Delete a booking by ID."""
-    stmt = db.select(Booking).where(Booking.booking_id == booking_id)
-    booking = db.session.scalar(stmt)
-    if booking:
-        db.session.delete(booking)
-        db.session.commit()
+    result = db.session.execute(db.delete(Booking).where(Booking.booking_id == booking_id)) # Single DELETE, no SELECT first
+    db.session.commit()
+    if result.rowcount:
+        invalidate("bookings")
         return {"message": f"Booking id {booking_id} has been deleted."}, 200
     else:
         return {"message": f"Booking with id {booking_id} doesn't exist."}, 404
\ No newline at end of file
@@ -10,6 +10,7 @@ Note:
 
 from flask import Blueprint
 from datetime import datetime
+from sqlalchemy import insert
 
 from init import db
 from models.ticket_holder import TicketHolder
@@ -37,63 +38,57 @@ def create_tables():
 
 @db_commands.cli.command("seed")
 def seed_tables():
-    """Seed database tables."""
+    """Seed database tables.
+    Each table is seeded with one multi-row INSERT ... RETURNING, capturing the
+    generated IDs for dependent tables, and everything is committed once at the end.
+    """
     # ========== SEED TICKET HOLDERS ==========
-    ticket_holders = [TicketHolder(
+    ticket_holder_ids = db.session.scalars(insert(TicketHolder).returning(TicketHolder.ticket_holder_id, sort_by_parameter_order = True), [dict(
         first_name = "Bobby",
         last_name = "Mac Manus",
         email = "bobby@email.com",
         phone_number = "+64424111222"
-    ), TicketHolder(
+    ), dict(
         first_name = "Susie",
         last_name = "Tinsdale",
         email = "susie@email.com",
         phone_number = "+64232666777"
-    ), TicketHolder(
+    ), dict(
         first_name = "Josie",
         last_name = "Roberts",
         email = "josie@email.com",
         phone_number = "+64232444333"
-    ), TicketHolder(
+    ), dict(
         first_name = "Lottie",
         last_name = "Timins",
         email = "lottie@email.com",
         phone_number = "+64424555688"
-    )]
-
-    db.session.add_all(ticket_holders)
-    db.session.commit()
+    )]).all()
 
     # ========== SEED ORGANISERS ==========
-    organisers = [Organiser(
+    organiser_ids = db.session.scalars(insert(Organiser).returning(Organiser.organiser_id, sort_by_parameter_order = True), [dict(
         full_name = "Johnnie Marks",
         email = "johnnie@email.com",
         phone_number = "0232333456"
-    ), Organiser(
+    ), dict(
         full_name = "Georgia Pierce-allen",
         email = "georgia@email.com",
         phone_number = "0888976543"
-    )]
-
-    db.session.add_all(organisers)
-    db.session.commit()
+    )]).all()
 
     # ========== SEED VENUES ==========
-    venues = [Venue(
+    venue_ids = db.session.scalars(insert(Venue).returning(Venue.venue_id, sort_by_parameter_order = True), [dict(
         name = "Rod Laver Arena",
         location = "200 Batman Ave, Melbourne VIC 3004",
         capacity = 15000
-    ), Venue(
+    ), dict(
         name = "Hordern Pavilion",
         location = "1 Driver Ave, Moore Park NSW 2021",
         capacity = 5000
-    )]
-
-    db.session.add_all(venues)
-    db.session.commit()
+    )]).all()
 
     # ========== SEED EVENTS ==========
-    events = [Event(
+    event_ids = db.session.scalars(insert(Event).returning(Event.event_id, sort_by_parameter_order = True), [dict(
         title = "Linkin Park: From Zero World Tour",
         description = """The band will perform both new hits like “The Emptiness Machine” and “Heavy Is The Crown” alongside iconic anthems spanning their 20+ year career. Following the release of “Heavy Is The Crown”, the official League of Legends World Championship Anthem and their first collaboration with Riot Games, Linkin Park reasserted their position as one of rock’s defining voices. The song’s hard-hitting rhythm and anthemic energy embody the bold, renewed spirit of the band, resonating with fans across the globe and paving the way for From Zero.
 
@@ -101,8 +96,8 @@ Linkin Park made their triumphant return to the spotlight with "The Emptiness Ma
 
 With over 54 million monthly listeners on Spotify and accolades from Billboard, The New York Times, and The Los Angeles Times on their recent singles, Linkin Park’s comeback has proven they are more influential than ever. Their timeless appeal, and their latest music has struck a powerful chord, propelling them to the forefront of rock music once again.""",
         duration_hours = 2.25,
-        organiser_id = organisers[0].organiser_id
-    ), Event(
+        organiser_id = organiser_ids[0]
+    ), dict(
         title = "Halsey: For My Last Trick",
         description = """Diamond-certified and GRAMMY®Award-nominated artist Halsey continues the celebration for the 10th anniversary of her triple platinum certified full-length debut album, BADLANDS, with the announcement of her Back to Badlands Tour
 
@@ -110,66 +105,58 @@ The new tour announce arrives on the heels of Halsey wrapping her “FOR MY LAST
 
 When BADLANDS was first released on August 28, 2015, it catapulted Halsey into music history. Since its release the album has sold over 3 Million albums-adjusted in the US, and has accumulated over 9 Billion on-demand streams worldwide. It is one of the only albums in music history to have every song, RIAA certified gold, platinum or multi-platinum. As well as multiple certifications in other countries including the UK, and Australia.""",
         duration_hours = 2.5,
-        organiser_id = organisers[1].organiser_id
-    )]
-
-    db.session.add_all(events)
-    db.session.commit()
+        organiser_id = organiser_ids[1]
+    )]).all()
 
     # ========== SEED SHOWS ==========
-    shows = [Show(
+    show_ids = db.session.scalars(insert(Show).returning(Show.show_id, sort_by_parameter_order = True), [dict(
         date_time = datetime.strptime("8-3-2026 | 7:00 PM", DATETIME_DISPLAY_FORMAT),
-        event_id = events[0].event_id,
-        venue_id = venues[0].venue_id
-    ), Show(
+        event_id = event_ids[0],
+        venue_id = venue_ids[0]
+    ), dict(
         date_time = datetime.strptime("9-3-2026 | 7:00 PM", DATETIME_DISPLAY_FORMAT),
-        event_id = events[0].event_id,
-        venue_id = venues[0].venue_id
-    ), Show(
+        event_id = event_ids[0],
+        venue_id = venue_ids[0]
+    ), dict(
         date_time = datetime.strptime("11-3-2026 | 7:00 PM", DATETIME_DISPLAY_FORMAT),
-        event_id = events[0].event_id,
-        venue_id = venues[1].venue_id
-    ), Show(
+        event_id = event_ids[0],
+        venue_id = venue_ids[1]
+    ), dict(
         date_time = datetime.strptime("13-2-2026 | 7:00 PM", DATETIME_DISPLAY_FORMAT),
-        event_id = events[1].event_id,
-        venue_id = venues[1].venue_id
-    ), Show(
+        event_id = event_ids[1],
+        venue_id = venue_ids[1]
+    ), dict(
         date_time = datetime.strptime("14-2-2026 | 7:00 PM", DATETIME_DISPLAY_FORMAT),
-        event_id = events[1].event_id,
-        venue_id = venues[1].venue_id
-    )]
-
-    db.session.add_all(shows)
-    db.session.commit()
+        event_id = event_ids[1],
+        venue_id = venue_ids[1]
+    )]).all()
 
     # ========== SEED BOOKINGS ==========
-    bookings = [Booking(
+    db.session.execute(insert(Booking), [dict(
         booking_status = BookingStatus.CONFIRMED,
         section = Section.GENERAL_ADMISSION_STANDING,
         seat_number = None,
-        ticket_holder_id = ticket_holders[0].ticket_holder_id,
-        show_id = shows[4].show_id
-    ), Booking(
+        ticket_holder_id = ticket_holder_ids[0],
+        show_id = show_ids[4]
+    ), dict(
         booking_status = BookingStatus.CONFIRMED,
         section = Section.SEATING,
         seat_number = "A32",
-        ticket_holder_id = ticket_holders[1].ticket_holder_id,
-        show_id = shows[3].show_id
-    ), Booking(
+        ticket_holder_id = ticket_holder_ids[1],
+        show_id = show_ids[3]
+    ), dict(
         booking_status = BookingStatus.CONFIRMED,
         section = Section.SEATING,
         seat_number = "G12",
-        ticket_holder_id = ticket_holders[3].ticket_holder_id,
-        show_id = shows[1].show_id
-    ), Booking(
+        ticket_holder_id = ticket_holder_ids[3],
+        show_id = show_ids[1]
+    ), dict(
         booking_status = BookingStatus.CONFIRMED,
         section = Section.GENERAL_ADMISSION_STANDING,
         seat_number = None,
-        ticket_holder_id = ticket_holders[2].ticket_holder_id,
-        show_id = shows[2].show_id
-    )]
+        ticket_holder_id = ticket_holder_ids[2],
+        show_id = show_ids[2]
+    )])
 
-    db.session.add_all(bookings)
     db.session.commit()
-
     print("Tables seeded.")
\ No newline at end of file
@@ -11,34 +11,57 @@ Note:
 """
 
 from flask import Blueprint, jsonify, request
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, load_only, selectinload
 from marshmallow import ValidationError
 
-from init import db
+from init import db, cache
 from models.event import Event
-from models.show import ShowStatus
+from models.show import Show, ShowStatus
+from models.booking import Booking
 from utils.constraints import BookingStatus
 from schemas.event_schema import event_schema, events_schema
+from utils.cache import cache_key_for, invalidate
+from utils.integrity import commit_unique
+from utils.loaders import list_load_options
 
 events_bp = Blueprint("events", __name__, url_prefix = "/events")
 
+# Unique constraint -> validation error reported to the client
+UNIQUE_EVENT_ERRORS = {
+    "unique_event_content": {"title": ["Event with this title and description already exists."]}
+}
+
+def event_loaders():
+    """Eager loaders for the relationships EventSchema dumps (shows with their venue, organiser).
+    Shows are a collection so they come in one extra IN query; the organiser is joined.
+    """
+    return (
+        selectinload(Event.shows).joinedload(Show.venue),
+        joinedload(Event.organiser)
+    )
+
 # ========= GET ALL EVENTS =========
 @events_bp.route("/", methods = ["GET"])
+@cache.cached(timeout = 300, make_cache_key = cache_key_for("events"))
 def get_events():
-    """Retrieve all events."""
-    stmt = db.select(Event)
-    events_list = db.session.scalars(stmt)
-    data = events_schema.dump(events_list)
-    if not data:
+    """Retrieve all events. Description is left out of list results (see get_one_event)."""
+    stmt = db.select(Event).options(*list_load_options(
+        load_only(Event.event_id, Event.title, Event.duration_hours, Event.organiser_id),
+        *event_loaders()
+    ))
+    events_list = db.session.scalars(stmt).all()
+    if not events_list:
         return {"message": "No events found. Please add an event to get started."}, 200
-    return jsonify(data), 200
+    return jsonify(events_schema.dump(events_list)), 200
 
 # ========= GET ONE EVENT =========
 @events_bp.route("/<int:event_id>", methods = ["GET"])
+@cache.cached(timeout = 300, make_cache_key = cache_key_for("events"))
 def get_one_event(event_id):
     """Retrieve one event by ID."""
-    stmt = db.select(Event).where(Event.event_id == event_id)
-    event = db.session.scalar(stmt)
+    event = db.session.get(Event, event_id, options = event_loaders()) # Load shows, venues and organiser up front for nested dump
     data = event_schema.dump(event)
     if data:
         return jsonify(data), 200
@@ -55,15 +78,15 @@ def create_event():
         session = db.session
     )
     db.session.add(new_event)
-    db.session.commit()
+    commit_unique(UNIQUE_EVENT_ERRORS)
+    invalidate("events", "organisers", "bookings", "shows", "venues")
     return event_schema.dump(new_event), 201
 
 # ========= UPDATE EVENT =========
 @events_bp.route("/<int:event_id>", methods = ["PUT", "PATCH"])
 def update_event(event_id):
     """Update an existing event by ID."""
-    stmt = db.select(Event).where(Event.event_id == event_id)
-    event = db.session.scalar(stmt)
+    event = db.session.get(Event, event_id)
     if not event:
         return {"message": f"Event with id {event_id} doesn't exist."}, 404
     else:
@@ -74,7 +97,8 @@ def update_event(event_id):
                 session = db.session,
                 partial = True
             )
-            db.session.commit()
+            commit_unique(UNIQUE_EVENT_ERRORS)
+            invalidate("events", "organisers", "bookings", "shows", "venues")
             return event_schema.dump(update_event), 200
         except ValidationError as err:
             return jsonify(err.messages), 400
@@ -86,15 +110,23 @@ def update_event(event_id):
 @events_bp.route("/<int:event_id>", methods = ["DELETE"])
 def delete_event(event_id):
     """Cancel an event by ID. Cancelling all associated shows and bookings."""
-    stmt = db.select(Event).where(Event.event_id == event_id)
-    event = db.session.scalar(stmt)
+    event = db.session.get(Event, event_id)
     if event:
-        for show in event.shows:  # Cancel all shows for this event
-            show.show_status = ShowStatus.CANCELLED
-            for booking in show.bookings:  # Cancel all bookings for this show
-                booking.booking_status = BookingStatus.CANCELLED
-        
+        event_show_ids = db.select(Show.show_id).where(Show.event_id == event_id)
+        db.session.execute( # Cancel all shows for this event in one UPDATE
+            update(Show)
+            .where(Show.event_id == event_id)
+            .values(show_status = ShowStatus.CANCELLED),
+            execution_options = {"synchronize_session": False}
+        )
+        db.session.execute( # Cancel all bookings for those shows in one UPDATE
+            update(Booking)
+            .where(Booking.show_id.in_(event_show_ids))
+            .values(booking_status = BookingStatus.CANCELLED),
+            execution_options = {"synchronize_session": False}
+        )
         db.session.commit()
+        invalidate("events", "organisers", "bookings", "shows", "venues")
         return {"message": f"Event with id {event_id} has been cancelled. All shows and bookings cancelled."}, 200
     else:
         return {"message": f"Event with id {event_id} doesn't exist."}, 404
\ No newline at end of file
@@ -12,31 +12,46 @@ Note:
 
 from flask import Blueprint, jsonify, request
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from marshmallow import ValidationError
 
-from init import db
+from init import db, cache
 from models.organiser import Organiser
 from schemas.organiser_schema import organiser_schema, organisers_schema
+from utils.cache import cache_key_for, invalidate
+from utils.integrity import commit_unique
+from utils.loaders import list_load_options
 
 organisers_bp = Blueprint("organisers", __name__, url_prefix = "/organisers")
 
+# Unique constraint -> validation error reported to the client
+UNIQUE_ORGANISER_ERRORS = {
+    "organisers_email_key": {"email": ["Email already exists."]}, # Named in the model's __table_args__
+    "organisers_phone_number_key": {"phone_number": ["Phone number already exists."]}
+}
+
+def organiser_loaders():
+    """Eager loaders for the relationships OrganiserSchema dumps (events), one extra IN query."""
+    return (
+        selectinload(Organiser.events),
+    )
+
 # ========= GET ALL ORGANISERS =========
 @organisers_bp.route("/", methods = ["GET"])
 def get_organisers():
     """Retrieve all organisers."""
-    stmt = db.select(Organiser)
-    organisers_list = db.session.scalars(stmt)
-    data = organisers_schema.dump(organisers_list)
-    if not data:
+    stmt = db.select(Organiser).options(*list_load_options(*organiser_loaders()))
+    organisers_list = db.session.scalars(stmt).all()
+    if not organisers_list:
         return {"message": "No organisers found."}, 200
-    return jsonify(data), 200
+    return jsonify(organisers_schema.dump(organisers_list)), 200
 
 # ========= GET ONE ORGANISER =========
 @organisers_bp.route("/<int:organiser_id>", methods = ["GET"])
+@cache.cached(timeout = 300, make_cache_key = cache_key_for("organisers"))
 def get_one_organiser(organiser_id):
     """Retrieve one organiser by ID."""
-    stmt = db.select(Organiser).where(Organiser.organiser_id == organiser_id)
-    organiser = db.session.scalar(stmt)
+    organiser = db.session.get(Organiser, organiser_id, options = organiser_loaders())
     data = organiser_schema.dump(organiser)
     if data:
         return jsonify(data), 200
@@ -53,15 +68,15 @@ def create_organiser():
         session = db.session
     )
     db.session.add(new_organiser)
-    db.session.commit()
+    commit_unique(UNIQUE_ORGANISER_ERRORS)
+    invalidate("events", "organisers")
     return organiser_schema.dump(new_organiser), 201
 
 # ========= UPDATE ORGANISER =========
 @organisers_bp.route("/<int:organiser_id>", methods = ["PUT", "PATCH"])
 def update_organiser(organiser_id):
     """Update an existing organiser by ID."""
-    stmt = db.select(Organiser).where(Organiser.organiser_id == organiser_id)
-    organiser = db.session.scalar(stmt)
+    organiser = db.session.get(Organiser, organiser_id)
     if not organiser:
         return {"message": f"Organiser with id {organiser_id} doesn't exist."}, 404
     else:
@@ -72,7 +87,8 @@ def update_organiser(organiser_id):
                 session = db.session,
                 partial = True
             )
-            db.session.commit()
+            commit_unique(UNIQUE_ORGANISER_ERRORS)
+            invalidate("events", "organisers")
             return organiser_schema.dump(update_organiser), 200
         except ValidationError as err:
             return jsonify(err.messages), 400
@@ -84,11 +100,11 @@ def update_organiser(organiser_id):
 @organisers_bp.route("/<int:organiser_id>", methods = ["DELETE"])
 def delete_organiser(organiser_id):
     """Delete organiser by ID."""
-    stmt = db.select(Organiser).where(Organiser.organiser_id == organiser_id)
-    organiser = db.session.scalar(stmt)
+    organiser = db.session.get(Organiser, organiser_id)
     if organiser:
         db.session.delete(organiser)
         db.session.commit()
+        invalidate("events", "organisers")
         return {"message": f"Organiser with id {organiser_id} has been deleted."}, 200
     else:
         return {"message": f"Organiser with id {organiser_id} doesn't exist."}, 404
\ No newline at end of file
@@ -11,33 +11,47 @@ Note:
     - Shows are never deleted from the database for audit/history purposes.
 """
 from flask import Blueprint, jsonify, request
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from marshmallow import ValidationError
 
-from init import db
+from init import db, cache
 from models.show import Show, ShowStatus
-from utils.constraints import BookingStatus
-from schemas.show_schema import show_schema, shows_schema
+from models.booking import Booking
+from utils.constraints import BookingStatus, DATE_DISPLAY_FORMAT
+from schemas.show_schema import show_schema
+from utils.cache import cache_key_for, invalidate
+from utils.integrity import commit_unique
+from utils.loaders import list_load_options
+from utils.streaming import stream_list
 
 shows_bp = Blueprint("shows", __name__, url_prefix = "/shows")
 
+def unique_show_errors(show):
+    """Unique index on shows -> validation error reported to the client, naming the clashing day."""
+    return {"uq_show_venue_day": {"venue_id": [f"Venue already has a show scheduled on {show.date_time.strftime(DATE_DISPLAY_FORMAT)}."]}}
+
+def show_loaders():
+    """Eager loaders for the relationships ShowSchema dumps (event, venue), both joined into the show query."""
+    return (
+        joinedload(Show.event),
+        joinedload(Show.venue)
+    )
+
 # ========= GET ALL SHOWS =========
 @shows_bp.route("/", methods = ["GET"])
 def get_shows():
     """Retrieve all shows from the database."""
-    stmt = db.select(Show)
-    shows_list = db.session.scalars(stmt)
-    data = shows_schema.dump(shows_list)
-    if not data:
-        return {"message": "No shows found. Please add a show to get started."}, 200
-    return jsonify(data), 200
+    stmt = db.select(Show).options(*list_load_options(*show_loaders()))
+    return stream_list(stmt, show_schema, "No shows found. Please add a show to get started.") # Rows are fetched and written in batches
 
 # ========= GET ONE SHOW =========
 @shows_bp.route("/<int:show_id>", methods = ["GET"])
+@cache.cached(timeout = 30, make_cache_key = cache_key_for("shows"))
 def get_one_show(show_id):
     """Retrieve a single show by its ID."""
-    stmt = db.select(Show).where(Show.show_id == show_id)
-    show = db.session.scalar(stmt)
+    show = db.session.get(Show, show_id, options = show_loaders()) # Event and venue in the same query
     data = show_schema.dump(show)
     if data:
         return jsonify(data), 200
@@ -54,36 +68,40 @@ def create_show():
         session = db.session
     )
 
-    existing_show = db.session.query(Show).filter( # Check if show already exists for this event, date and venue
-        Show.event_id == new_show.event_id,
-        Show.date_time == new_show.date_time,
-        Show.venue_id == new_show.venue_id
-    ).first()
-
-    if existing_show:
-        return {"message": "A show for this event, date, and venue already exists."}, 409
+    if new_show.venue_id is None: # NULL venue_ids never collide in uq_show_venue_day, so check venue-less shows by hand
+        existing_show_id = db.session.scalar(db.select(Show.show_id).where(
+            Show.event_id == new_show.event_id,
+            Show.date_time == new_show.date_time,
+            Show.venue_id.is_(None)
+        ).limit(1))
+        if existing_show_id is not None:
+            return {"message": "A show for this event, date, and venue already exists."}, 409
 
     db.session.add(new_show)
-    db.session.commit()
+    commit_unique(unique_show_errors(new_show)) # uq_show_venue_day rejects a second show at a venue that day, no SELECT beforehand
+    invalidate("events", "bookings", "shows", "venues")
     return show_schema.dump(new_show), 201
 
 # ========= UPDATE SHOW =========
 @shows_bp.route("/<int:show_id>", methods = ["PUT", "PATCH"])
 def update_show(show_id):
     """Update existing show by its ID."""
-    stmt = db.select(Show).where(Show.show_id == show_id)
-    show = db.session.scalar(stmt)
+    show = db.session.get(Show, show_id)
     if not show:
         return {"message": f"Show with id {show_id} doesn't exist."}, 404
     else:
+        body_data = request.get_json()
+        if body_data == {}: # Nothing to change, skip the load and the commit
+            return show_schema.dump(show), 200
         try:
             update_show = show_schema.load(
-                request.get_json(),
+                body_data,
                 instance = show,
                 session = db.session,
                 partial = True
             )
-            db.session.commit()
+            commit_unique(unique_show_errors(update_show))
+            invalidate("events", "bookings", "shows", "venues")
             return show_schema.dump(update_show), 200
         except ValidationError as err:
             return jsonify(err.messages), 400
@@ -95,16 +113,17 @@ def update_show(show_id):
 @shows_bp.route("/<int:show_id>", methods = ["DELETE"])
 def delete_show(show_id):
     """Cancel a show by its ID. Cancels all associated bookings."""
-    stmt = db.select(Show).where(Show.show_id == show_id)
-    show = db.session.scalar(stmt)
+    show = db.session.get(Show, show_id)
     if not show:
         return {"message": f"Show with id {show_id} doesn't exist."}, 404
 
     show.show_status = ShowStatus.CANCELLED
-    
-    # Cancel all bookings for this show
-    for booking in show.bookings:
-        booking.booking_status = BookingStatus.CANCELLED
-    
+    db.session.execute( # Cancel all bookings for this show in one UPDATE
+        update(Booking)
+        .where(Booking.show_id == show_id, Booking.booking_status != BookingStatus.CANCELLED)
+        .values(booking_status = BookingStatus.CANCELLED),
+        execution_options = {"synchronize_session": False}
+    )
     db.session.commit()
+    invalidate("events", "bookings", "shows", "venues")
     return {"message": f"Show id {show_id} has been cancelled. All bookings for this show cancelled."}, 200
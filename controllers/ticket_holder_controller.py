@@ -14,33 +14,49 @@ Note:
 from datetime import datetime
 
 from flask import Blueprint, jsonify, request
+from sqlalchemy import exists
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
 from marshmallow import ValidationError
 
 from init import db
 from models.ticket_holder import TicketHolder
-from models.booking import BookingStatus
-from schemas.ticket_holder_schema import ticket_holder_schema, ticket_holders_schema
+from models.booking import Booking, BookingStatus
+from models.show import Show
+from schemas.ticket_holder_schema import ticket_holder_schema
+from utils.cache import invalidate
+from utils.integrity import commit_unique
+from utils.loaders import list_load_options
+from utils.streaming import stream_list
 
 ticket_holders_bp = Blueprint("ticket_holders", __name__, url_prefix = "/ticket_holders")
 
+# Unique constraint -> validation error reported to the client
+UNIQUE_TICKET_HOLDER_ERRORS = {
+    "ticket_holders_email_key": {"email": ["Email already exists."]}, # Named in the model's __table_args__
+    "ticket_holders_phone_number_key": {"phone_number": ["Phone number already exists."]}
+}
+
+def ticket_holder_loaders():
+    """Eager loaders for the relationships TicketHolderSchema dumps (bookings with their show and event).
+    Bookings come in one extra IN query with show and event joined into it.
+    """
+    return (
+        selectinload(TicketHolder.bookings).joinedload(Booking.show).joinedload(Show.event),
+    )
+
 # ======== GET ALL TICKET HOLDERS ========
 @ticket_holders_bp.route("/", methods = ["GET"])
 def get_ticket_holders():
     """Retrieve all ticket holders."""
-    stmt = db.select(TicketHolder)
-    ticket_holders_list = db.session.scalars(stmt)
-    data = ticket_holders_schema.dump(ticket_holders_list)
-    if not data:
-        return {"message": "No ticket holders found."}, 200
-    return jsonify(data), 200
+    stmt = db.select(TicketHolder).options(*list_load_options(*ticket_holder_loaders()))
+    return stream_list(stmt, ticket_holder_schema, "No ticket holders found.") # Rows are fetched and written in batches
 
 # ========= GET ONE TICKET HOLDER ========
 @ticket_holders_bp.route("/<int:ticket_holder_id>", methods = ["GET"])
 def get_one_ticket_holder(ticket_holder_id):
     """Retrieve one ticket holder by ID."""
-    stmt = db.select(TicketHolder).where(TicketHolder.ticket_holder_id == ticket_holder_id)
-    ticket_holder = db.session.scalar(stmt)
+    ticket_holder = db.session.get(TicketHolder, ticket_holder_id, options = ticket_holder_loaders())
     data = ticket_holder_schema.dump(ticket_holder)
     if data:
         return jsonify(data), 200
@@ -57,15 +73,15 @@ def create_ticket_holder():
         session = db.session
     )
     db.session.add(new_ticket_holder)
-    db.session.commit()
+    commit_unique(UNIQUE_TICKET_HOLDER_ERRORS)
+    invalidate("bookings")
     return ticket_holder_schema.dump(new_ticket_holder), 201
 
 # ========= UPDATE TICKET HOLDER ========
 @ticket_holders_bp.route("/<int:ticket_holder_id>", methods = ["PUT", "PATCH"])
 def update_ticket_holder(ticket_holder_id):
     """Update ticket holder by ID."""
-    stmt = db.select(TicketHolder).where(TicketHolder.ticket_holder_id == ticket_holder_id)
-    ticket_holder = db.session.scalar(stmt)
+    ticket_holder = db.session.get(TicketHolder, ticket_holder_id)
     if not ticket_holder:
         return {"message": f"Ticket holder with id {ticket_holder_id} doesn't exist."}, 404
     else:
@@ -76,7 +92,8 @@ def update_ticket_holder(ticket_holder_id):
                 session = db.session,
                 partial = True
             )
-            db.session.commit()
+            commit_unique(UNIQUE_TICKET_HOLDER_ERRORS)
+            invalidate("bookings")
             return ticket_holder_schema.dump(update_ticket_holder), 200
         except ValidationError as err:
             return jsonify(err.messages), 400
@@ -88,18 +105,19 @@ def update_ticket_holder(ticket_holder_id):
 @ticket_holders_bp.route("/<int:ticket_holder_id>", methods = ["DELETE"])
 def delete_ticket_holder(ticket_holder_id):
     """Delete ticket holder by ID, if no future confirmed bookings exist."""
-    stmt = db.select(TicketHolder).where(TicketHolder.ticket_holder_id == ticket_holder_id)
-    ticket_holder = db.session.scalar(stmt)
+    ticket_holder = db.session.get(TicketHolder, ticket_holder_id)
     if ticket_holder:
-        current_date = datetime.now()
-        future_confirmed_bookings = [
-            booking for booking in ticket_holder.bookings
-            if booking.booking_status == BookingStatus.CONFIRMED and booking.show and booking.show.date_time > current_date
-        ]
-        if future_confirmed_bookings:
+        has_future_confirmed_bookings = db.session.scalar(db.select(exists().where( # One EXISTS query instead of loading every booking and its show
+            Booking.ticket_holder_id == ticket_holder_id,
+            Booking.booking_status == BookingStatus.CONFIRMED,
+            Booking.show_id == Show.show_id,
+            Show.date_time > datetime.now()
+        )))
+        if has_future_confirmed_bookings:
             return {"message": f"Ticket holder with id {ticket_holder_id} can't be deleted because they have future confirmed bookings."}, 400
         db.session.delete(ticket_holder)
         db.session.commit()
+        invalidate("bookings")
         return {"message": f"Ticket holder with id {ticket_holder_id} has been deleted."}, 200
     else:
         return {"message": f"Ticket holder with id {ticket_holder_id} doesn't exist."}, 404
\ No newline at end of file
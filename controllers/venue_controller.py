@@ -11,32 +11,46 @@ Note:
 """
 
 from flask import Blueprint, jsonify, request
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
 from marshmallow import ValidationError
 
-from init import db
+from init import db, cache
 from models.venue import Venue
-from schemas.venue_schema import venue_schema, venues_schema
+from models.show import Show
+from schemas.venue_schema import venue_schema
+from utils.cache import cache_key_for, invalidate
+from utils.integrity import commit_unique
+from utils.loaders import list_load_options
+from utils.streaming import stream_list
 
 venues_bp = Blueprint("venues", __name__, url_prefix = "/venues")
 
+# Unique constraint -> validation error reported to the client
+UNIQUE_VENUE_ERRORS = {
+    "venues_name_key": {"name": ["Venue name already exists."]} # Named in the model's __table_args__
+}
+
+def venue_loaders():
+    """Eager loaders for the relationships VenueSchema dumps (shows with their event), one extra IN query."""
+    return (
+        selectinload(Venue.shows).joinedload(Show.event),
+    )
+
 # ========= GET ALL VENUES =========
 @venues_bp.route("/", methods = ["GET"])
 def get_venues():
     """Retrieve all venues."""
-    stmt = db.select(Venue)
-    venues_list = db.session.scalars(stmt)
-    data = venues_schema.dump(venues_list)
-    if not data:
-        return {"message": "No venues found. Please add a venue to get started."}, 200
-    return jsonify(data), 200
+    stmt = db.select(Venue).options(*list_load_options(*venue_loaders()))
+    return stream_list(stmt, venue_schema, "No venues found. Please add a venue to get started.") # Rows are fetched and written in batches
 
 # ========= GET ONE VENUE =========
 @venues_bp.route("/<int:venue_id>", methods = ["GET"])
+@cache.cached(timeout = 30, make_cache_key = cache_key_for("venues"))
 def get_one_venue(venue_id):
     """Retrieve one venue by ID."""
-    stmt = db.select(Venue).where(Venue.venue_id == venue_id)
-    venue = db.session.scalar(stmt)
+    venue = db.session.get(Venue, venue_id, options = venue_loaders())
     data = venue_schema.dump(venue)
     if data:
         return jsonify(data), 200
@@ -53,15 +67,15 @@ def create_venue():
         session = db.session
     )
     db.session.add(new_venue)
-    db.session.commit()
+    commit_unique(UNIQUE_VENUE_ERRORS)
+    invalidate("events", "shows", "venues")
     return venue_schema.dump(new_venue), 201
 
 # ========= UPDATE VENUE =========
 @venues_bp.route("/<int:venue_id>", methods=["PUT", "PATCH"])
 def update_venue(venue_id):
     """Update an existing venue by ID."""
-    stmt = db.select(Venue).where(Venue.venue_id == venue_id)
-    venue = db.session.scalar(stmt)
+    venue = db.session.get(Venue, venue_id)
     if not venue:
         return {"message": f"Venue with id {venue_id} doesn't exist."}, 404
     try:
@@ -71,7 +85,8 @@ def update_venue(venue_id):
             session=db.session,
             partial=True,
         )
-        db.session.commit()
+        commit_unique(UNIQUE_VENUE_ERRORS)
+        invalidate("events", "shows", "venues")
         return venue_schema.dump(update_venue), 200
     except ValidationError as err:
         return jsonify(err.messages), 400
@@ -83,15 +98,18 @@ def update_venue(venue_id):
 @venues_bp.route("/<int:venue_id>", methods = ["DELETE"])
 def delete_venue(venue_id):
     """Delete a venue by ID. Updates related shows to display 'Venue To Be Announced'."""
-    stmt = db.select(Venue).where(Venue.venue_id == venue_id)
-    venue = db.session.scalar(stmt)
-    if venue:
-        show_count = len(venue.shows) if venue.shows else 0
-        db.session.delete(venue)
-        db.session.commit()
-        if show_count > 0:
-            return {"message": f"Venue with id {venue_id} has been deleted. {show_count} shows now display 'Venue To Be Announced'."}, 200
-        else:
-            return {"message": f"Venue with id {venue_id} has been deleted."}, 200
+    show_count = db.session.execute( # Move its shows to 'Venue To Be Announced' in one UPDATE
+        update(Show)
+        .where(Show.venue_id == venue_id)
+        .values(venue_id = None),
+        execution_options = {"synchronize_session": False}
+    ).rowcount
+    deleted = db.session.execute(delete(Venue).where(Venue.venue_id == venue_id)).rowcount
+    db.session.commit()
+    if not deleted:
+        return {"message": f"Venue with id {venue_id} doesn't exist."}, 404
+    invalidate("events", "shows", "venues")
+    if show_count > 0:
+        return {"message": f"Venue with id {venue_id} has been deleted. {show_count} shows now display 'Venue To Be Announced'."}, 200
     else:
-        return {"message": f"Venue with id {venue_id} doesn't exist."}, 404
\ No newline at end of file
+        return {"message": f"Venue with id {venue_id} has been deleted."}, 200
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""Gunicorn configuration for serving the GigMate API in production.
+
+Uses threaded workers so requests blocked on database I/O overlap within a
+worker instead of capping concurrency at the worker count.
+Run with: gunicorn (this file is picked up automatically from the project root).
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "main:create_app()"
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread" # Thread pool per worker, DB waits release the GIL
+threads = int(os.getenv("GUNICORN_THREADS", 4)) # Also the default DB pool size per worker (main.py)
\ No newline at end of file
@@ -1,3 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
 
-db = SQLAlchemy() # Initialize the SQLAlchemy object
\ No newline at end of file
+db = SQLAlchemy() # Initialize the SQLAlchemy object
+cache = Cache() # Initialize the response cache (Redis when REDIS_URL is set)
\ No newline at end of file
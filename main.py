@@ -9,7 +9,7 @@ import os
 from flask import Flask, jsonify
 from dotenv import load_dotenv
 
-from init import db
+from init import db, cache
 from controllers.cli_controller import db_commands
 from controllers.ticket_holder_controller import ticket_holders_bp
 from controllers.organiser_controller import organisers_bp
@@ -17,7 +17,10 @@ from controllers.venue_controller import venues_bp
 from controllers.event_controller import events_bp
 from controllers.show_controller import shows_bp
 from controllers.booking_controller import bookings_bp
+from controllers.batch_controller import batch_bp
 from utils.error_handlers import error_handlers
+from utils.etag import register_etags
+from utils.json_provider import OrjsonProvider
 
 load_dotenv()
 
@@ -28,8 +31,20 @@ def create_app():
     app = Flask(__name__)
     print("Flask server started.")
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URI")
+    if not str(app.config['SQLALCHEMY_DATABASE_URI']).startswith("sqlite"): # SQLite (tests) uses its own pool
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = { # Reuse pooled connections, drop stale ones before use
+            "pool_size": int(os.getenv("DB_POOL_SIZE", os.getenv("GUNICORN_THREADS", 4))), # One connection per gunicorn thread, see README for sizing
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 2)),
+            "pool_pre_ping": True,
+            "pool_recycle": 1800
+        }
+    app.json = OrjsonProvider(app) # Serialize JSON responses with orjson
     app.json.sort_keys = False # keep order of keys in JSON
+    app.config['CACHE_TYPE'] = "RedisCache" if os.getenv("REDIS_URL") else "NullCache" # No shared cache without Redis
+    app.config['CACHE_REDIS_URL'] = os.getenv("REDIS_URL")
+    app.config['ETAGS'] = os.getenv("ETAGS", "true").lower() != "false" # Hashing every GET body can be switched off
     db.init_app(app) # Initialize the database with the app
+    cache.init_app(app) # Initialize the response cache with the app
     app.register_blueprint(db_commands) # Register CLI commands blueprint
     app.register_blueprint(ticket_holders_bp) # Register API blueprints
     app.register_blueprint(organisers_bp)
@@ -37,8 +52,10 @@ def create_app():
     app.register_blueprint(events_bp)
     app.register_blueprint(shows_bp)
     app.register_blueprint(bookings_bp)
+    app.register_blueprint(batch_bp)
 
     error_handlers(app) # Register global error handlers
+    register_etags(app) # Answer repeat GETs with 304 Not Modified
     
     @app.route("/") # Define home route with detailed welcome message
     def home():
@@ -4,7 +4,7 @@ Contains the Booking class which represents ticket bookings for shows,
 including constraints for unique bookings and seat allocations.
 """
 
-from sqlalchemy import func, UniqueConstraint
+from sqlalchemy import func, text, Index, UniqueConstraint
 from sqlalchemy.types import Enum
 
 from init import db
@@ -26,7 +26,11 @@ class Booking(db.Model):
 
     Constraints:
         - Unique combination of ticket_holder_id and show_id (one booking per ticket holder per show).
-        - Unique seat_number per show for seated sections.
+        - Unique seat_number per show among CONFIRMED bookings (partial unique index), so a seat
+          freed by a cancelled or refunded booking can be booked again.
+
+    Indexes:
+        - (show_id, booking_status) for cancelling or counting a show's bookings.
         
     Relationships and delete behavior:
         - Each booking is linked to one TicketHolder and one Show.
@@ -45,7 +49,9 @@ class Booking(db.Model):
 
     __table_args__ = (
         UniqueConstraint("ticket_holder_id", "show_id", name = "booking_unique_ticket_holder_show"),
-        UniqueConstraint("show_id", "seat_number", name = "unique_seat_per_show"), # Enforce seat uniqueness when seat_number is not null
+        Index("unique_seat_per_show", "show_id", "seat_number", unique = True, # Only confirmed bookings hold a seat, NULL seat_numbers never collide
+              postgresql_where = text("booking_status = 'CONFIRMED'"), sqlite_where = text("booking_status = 'CONFIRMED'")),
+        Index("ix_booking_status_show", "show_id", "booking_status"),
     )
 
     ticket_holder = db.relationship("TicketHolder", back_populates = "bookings")
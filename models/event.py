@@ -4,7 +4,7 @@ Contains the Event class which represents events that can have multiple shows,
 including constraints for duration and uniqueness of content.
 """
 
-from sqlalchemy import CheckConstraint, UniqueConstraint
+from sqlalchemy import CheckConstraint, Index, UniqueConstraint
 
 from init import db
 
@@ -24,10 +24,13 @@ class Event(db.Model):
         - duration_hours must between 1 and 12.
         - Unique combination of title and description to prevent duplicates.
 
+    Indexes:
+        - organiser_id for loading an organiser's events and SET NULL on organiser delete.
+
     Relationships and delete behavior:
         - Each event is organised by one organiser (organiser_id set to NULL if
           organiser deleted or not defined and assigns a placeholder 'To Be Determined').
-        - Each event can have multiple shows; deleting an event deletes all its shows.
+        - Each event can have multiple shows, listed in date order; deleting an event deletes all its shows.
     """
     __tablename__ = "events"
 
@@ -41,7 +44,8 @@ class Event(db.Model):
         CheckConstraint("duration_hours >= 1", name = 'check_duration_min'),
         CheckConstraint("duration_hours <= 12", name = 'check_duration_max'),
         UniqueConstraint('title', 'description', name = 'unique_event_content'),
+        Index("ix_event_organiser_id", "organiser_id"),
     )
     
     organiser = db.relationship("Organiser", back_populates = "events")
-    shows = db.relationship("Show", back_populates = "event", cascade = "all, delete-orphan")
\ No newline at end of file
+    shows = db.relationship("Show", back_populates = "event", cascade = "all, delete-orphan", order_by = "Show.date_time") # Served by ix_show_event_date_time
\ No newline at end of file
@@ -4,7 +4,7 @@ Contains the Organiser class which represents organisers who create and manage e
 including constraints for email, phone, and name formats.
 """
 
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, UniqueConstraint
 
 from init import db
 from utils.constraints import email_regex, phone_regex, name_regex
@@ -33,13 +33,17 @@ class Organiser(db.Model):
     
     organiser_id = db.Column(db.Integer, primary_key = True)
     full_name = db.Column(db.String(50), nullable = False)
-    email = db.Column(db.String(100), nullable = False, unique = True)
-    phone_number = db.Column(db.String(15), nullable = False, unique = True)
+    email = db.Column(db.String(100), nullable = False)
+    phone_number = db.Column(db.String(15), nullable = False)
 
     __table_args__ = (
-        CheckConstraint(f"full_name ~ '{name_regex}'", name = 'check_full_name_format'),
-        CheckConstraint(f"email ~ '{email_regex}'", name = 'check_email_format'),
-        CheckConstraint(f"phone_number ~ '{phone_regex}'", name = 'check_phone_format')
+        # Named as Postgres names unique = True columns, so existing databases and the controllers' error maps match
+        UniqueConstraint("email", name = "organisers_email_key"),
+        UniqueConstraint("phone_number", name = "organisers_phone_number_key"),
+        # Regex CHECKs use Postgres' ~ operator, so they are only created on Postgres (the schemas check the same patterns)
+        CheckConstraint(f"full_name ~ '{name_regex}'", name = 'check_full_name_format').ddl_if(dialect = "postgresql"),
+        CheckConstraint(f"email ~ '{email_regex}'", name = 'check_email_format').ddl_if(dialect = "postgresql"),
+        CheckConstraint(f"phone_number ~ '{phone_regex}'", name = 'check_phone_format').ddl_if(dialect = "postgresql")
     )
 
     events = db.relationship("Event", back_populates = "organiser", passive_deletes=True)
\ No newline at end of file
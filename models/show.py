@@ -4,7 +4,7 @@ Contains the Show class which represents individual show instances of events,
 including constraints for unique show occurrences and future scheduling.
 """
 
-from sqlalchemy import CheckConstraint, UniqueConstraint
+from sqlalchemy import Index, func, text
 from sqlalchemy.types import Enum
 
 from init import db
@@ -24,8 +24,14 @@ class Show(db.Model):
         bookings (list[Booking]): List of bookings associated with this show.
 
     Constraints:
-        - Each venue can only have one show per day.
-        - Shows must be scheduled in the future.
+        - Each venue can only have one show per day (unique index on venue_id and the date of date_time).
+        - Shows must be scheduled in the future (checked in ShowSchema on create/update,
+          not a CHECK constraint, so shows that have passed can still be cancelled or edited).
+
+    Indexes:
+        - (venue_id, date(date_time)), unique: one show per venue per day, also used for loading a venue's shows.
+        - (event_id, date_time) for loading or cancelling all shows of an event, in date order,
+          and for the duplicate check on venue-less shows.
 
     Relationships and delete behavior:
         - Each show belongs to exactly one event.
@@ -44,8 +50,8 @@ class Show(db.Model):
     venue_id = db.Column(db.Integer, db.ForeignKey("venues.venue_id", ondelete = "SET NULL"), nullable = True)
     
     __table_args__ = (
-        UniqueConstraint('venue_id', 'date_time', name='unique_show_occurrence'),
-        CheckConstraint("date_time > CURRENT_TIMESTAMP", name='check_future_show')
+        Index("uq_show_venue_day", "venue_id", func.date(text("date_time")), unique = True), # date() works as a cast in Postgres and SQLite
+        Index("ix_show_event_date_time", "event_id", "date_time")
     )
     
     event = db.relationship("Event", back_populates = "shows")
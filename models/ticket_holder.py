@@ -4,7 +4,7 @@ Contains the TicketHolder class which represents individuals who purchase ticket
 including constraints for valid names, emails, and phone numbers.
 """
 
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, UniqueConstraint
 
 from init import db
 from utils.constraints import email_regex, phone_regex, name_regex
@@ -35,14 +35,18 @@ class TicketHolder(db.Model):
     ticket_holder_id = db.Column(db.Integer, primary_key = True)
     first_name = db.Column(db.String(20), nullable = False)
     last_name = db.Column(db.String(30), nullable = False)
-    email = db.Column(db.String(100), nullable = False, unique = True)
-    phone_number = db.Column(db.String(15), nullable = False, unique = True)
+    email = db.Column(db.String(100), nullable = False)
+    phone_number = db.Column(db.String(15), nullable = False)
 
     __table_args__ = (
-        CheckConstraint(f"email ~ '{email_regex}'", name = 'check_email_format'),
-        CheckConstraint(f"phone_number ~ '{phone_regex}'", name = 'check_phone_format'),
-        CheckConstraint(f"first_name ~ '{name_regex}'", name = 'check_first_name_format'),
-        CheckConstraint(f"last_name ~ '{name_regex}'", name = 'check_last_name_format'),
+        # Named as Postgres names unique = True columns, so existing databases and the controllers' error maps match
+        UniqueConstraint("email", name = "ticket_holders_email_key"),
+        UniqueConstraint("phone_number", name = "ticket_holders_phone_number_key"),
+        # Regex CHECKs use Postgres' ~ operator, so they are only created on Postgres (the schemas check the same patterns)
+        CheckConstraint(f"email ~ '{email_regex}'", name = 'check_email_format').ddl_if(dialect = "postgresql"),
+        CheckConstraint(f"phone_number ~ '{phone_regex}'", name = 'check_phone_format').ddl_if(dialect = "postgresql"),
+        CheckConstraint(f"first_name ~ '{name_regex}'", name = 'check_first_name_format').ddl_if(dialect = "postgresql"),
+        CheckConstraint(f"last_name ~ '{name_regex}'", name = 'check_last_name_format').ddl_if(dialect = "postgresql"),
     )
 
     bookings = db.relationship("Booking", back_populates = "ticket_holder")
\ No newline at end of file
@@ -4,7 +4,7 @@ Contains the Venue class which represents physical locations where shows take pl
 including constraints for capacity, name, and address formatting.
 """
 
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, UniqueConstraint
 
 from init import db
 from utils.constraints import venue_name_regex, venue_location_regex
@@ -31,15 +31,18 @@ class Venue(db.Model):
     __tablename__ = "venues"
 
     venue_id = db.Column(db.Integer, primary_key = True)
-    name = db.Column(db.String(30), nullable = False, unique = True)
+    name = db.Column(db.String(30), nullable = False)
     location = db.Column(db.String(100), nullable = False)
     capacity = db.Column(db.Integer, nullable = False)
 
     __table_args__ = (
+        # Named as Postgres names unique = True columns, so existing databases and the controllers' error maps match
+        UniqueConstraint("name", name = "venues_name_key"),
         CheckConstraint("capacity >= 1", name='check_capacity_positive'),
         CheckConstraint("capacity <= 200000", name='check_capacity_realistic'), # Max realistic venue capacity
-        CheckConstraint(f"name ~ '{venue_name_regex}'", name='check_name_format'),
-        CheckConstraint(f"location ~ '{venue_location_regex}'", name='check_address_format'), # Validate Google Maps style address
+        # Regex CHECKs use Postgres' ~ operator, so they are only created on Postgres (the schemas check the same patterns)
+        CheckConstraint(f"name ~ '{venue_name_regex}'", name='check_name_format').ddl_if(dialect = "postgresql"),
+        CheckConstraint(f"location ~ '{venue_location_regex}'", name='check_address_format').ddl_if(dialect = "postgresql"), # Validate Google Maps style address
     )
 
     shows = db.relationship("Show", back_populates = "venue")
\ No newline at end of file
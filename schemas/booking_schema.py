@@ -6,12 +6,11 @@ formatting in API endpoints and data processing.
 """
 
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
-from marshmallow import fields, pre_load, post_dump, validate, validates_schema, ValidationError
+from marshmallow import fields, pre_load, validate, validates_schema, ValidationError
 
-from init import db
 from models.booking import Booking
 from utils.validators import seat_number_regex, seat_number_validation_error
-from utils.constraints import DATE_DISPLAY_FORMAT
+from utils.constraints import BookingStatus, Section, DATE_DISPLAY_FORMAT
 
 class BookingSchema(SQLAlchemyAutoSchema):
     """
@@ -36,12 +35,9 @@ class BookingSchema(SQLAlchemyAutoSchema):
         - Required when section is SEATING
         - Forbidden when section is GENERAL_ADMISSION_STANDING
         - Must match regex pattern if provided
-    - Unique constraints:
+    - Unique constraints (enforced by the database, reported by booking_controller.commit_bookings):
         - Ticket holder cannot have multiple bookings for the same show
         - Seat cannot be double-booked for the same show
-
-Post-dump:
-    - Converts enum fields (booking_status, section) to plain string values
     """
     class Meta:
         model = Booking
@@ -52,8 +48,8 @@ Post-dump:
     ticket_holder = fields.Nested("TicketHolderSchema", dump_only=True, only=("first_name", "last_name"))
     show = fields.Nested("ShowSchema", dump_only=True, only=("date_time", "event"))
 
-    booking_status = fields.Str(validate = validate.OneOf(['CONFIRMED', 'CANCELLED', 'REFUNDED'], error = "Booking status must be one of: CONFIRMED, CANCELLED, REFUNDED."))
-    section = fields.Str(validate = validate.OneOf(['GENERAL_ADMISSION_STANDING', 'SEATING'], error = "Section must be one of: GENERAL_ADMISSION_STANDING, SEATING."))
+    booking_status = fields.Enum(BookingStatus, error_messages = {"unknown": "Booking status must be one of: CONFIRMED, CANCELLED, REFUNDED."}) # Dumps the member name directly
+    section = fields.Enum(Section, error_messages = {"unknown": "Section must be one of: GENERAL_ADMISSION_STANDING, SEATING."})
     seat_number = fields.Str(allow_none=True, validate=[validate.Length(min=1, max=4), validate.Regexp(seat_number_regex, error=seat_number_validation_error)])
     booking_date = fields.Date(format=DATE_DISPLAY_FORMAT, dump_only=True)
     ticket_holder_id = fields.Integer(required=True, validate=[validate.Range(min=1)])
@@ -61,42 +57,14 @@ Post-dump:
 
     @validates_schema
     def validate_booking(self, data, **kwargs):
-        ticket_holder_id = data.get("ticket_holder_id")
-        show_id = data.get("show_id")
         seat_number = data.get("seat_number")
         section = data.get("section")
-        instance_id = getattr(self, "instance", None) and getattr(self.instance, "booking_id", None)
 
-        if section == "SEATING" and not seat_number:
+        if section == Section.SEATING and not seat_number:
             raise ValidationError({"seat_number": ["Required when section is SEATING. Format: 1-2 letters followed by 1-2 digits (e.g., 'A1', 'B12', 'AA10')."]})
-        if section == "GENERAL_ADMISSION_STANDING" and seat_number:
+        if section == Section.GENERAL_ADMISSION_STANDING and seat_number:
             raise ValidationError({"seat_number": ["Seat number must not be provided for GENERAL_ADMISSION_STANDING bookings."]})
 
-        if ticket_holder_id and show_id:
-            query = db.session.query(Booking).filter_by(ticket_holder_id = ticket_holder_id, show_id = show_id)
-            if instance_id:
-                query = query.filter(Booking.booking_id != instance_id)
-            if query.first():
-                raise ValidationError({"ticket_holder_id": ["This ticket holder already has a booking for this show."]})
-            
-        if seat_number and show_id:
-            query = db.session.query(Booking).filter_by(show_id = show_id, seat_number = seat_number)
-            if instance_id:
-                query = query.filter(Booking.booking_id != instance_id)
-            if query.first():
-                raise ValidationError({"seat_number": [f"Seat {seat_number} is already booked for this show."]})
-            
-    @post_dump
-    def convert_enum_to_value(self, data, **kwargs):
-        for field_name in ('booking_status', 'section'):
-            value = data.get(field_name)
-            if value:
-                if hasattr(value, 'value'):
-                    data[field_name] = value.value
-                elif isinstance(value, str) and '.' in value:
-                    data[field_name] = value.split('.')[-1]
-        return data
-    
     @pre_load
     def reject_manual_booking_date(self, data, **kwargs):
         if "booking_date" in data:
@@ -7,9 +7,8 @@ formatting in API endpoints and data processing.
 """
 
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, auto_field
-from marshmallow import fields, pre_load, post_dump, post_load, validate, ValidationError
+from marshmallow import fields, pre_load, post_dump, validate
 
-from init import db
 from models.event import Event
 
 class EventSchema(SQLAlchemyAutoSchema):
@@ -32,8 +31,8 @@ class EventSchema(SQLAlchemyAutoSchema):
     Pre-load:
         - Trim whitespace from title and description
 
-    Post-load:
-        - Ensure combination of title + description is unique in the database
+    Uniqueness:
+        - Combination of title + description is unique (enforced by the database, reported by controllers.event_controller)
     
     Post-dump:
         - Add placeholder organiser if none assigned ('To Be Determined')
@@ -63,18 +62,6 @@ class EventSchema(SQLAlchemyAutoSchema):
             if isinstance(description, str):
                 data['description'] = description.strip()
         return data
-
-    @post_load
-    def check_uniqueness(self, data, **kwargs):
-        title = data.get('title')
-        description = data.get('description')
-        if title and description:
-            query = db.session.query(Event).filter_by(title = title, description = description)
-            if getattr(self, 'instance', None):
-                query = query.filter(Event.event_id != self.instance.event_id)
-            if query.first():
-                raise ValidationError({"title": ["Event with this title and description already exists."]})
-        return data
     
     @post_dump
     def add_organiser_placeholder(self, data, **kwargs):
@@ -83,4 +70,4 @@ class EventSchema(SQLAlchemyAutoSchema):
         return data
 
 event_schema = EventSchema()
-events_schema = EventSchema(many = True)
\ No newline at end of file
+events_schema = EventSchema(many = True, exclude = ("description",)) # Description only on detail views
\ No newline at end of file
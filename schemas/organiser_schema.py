@@ -6,9 +6,8 @@ output formatting in API endpoints and data processing.
 """
 
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, auto_field
-from marshmallow import fields, pre_load, post_load, ValidationError
+from marshmallow import fields, pre_load
 
-from init import db
 from models.organiser import Organiser
 from utils.validators import email_validators, phone_validators, full_name_validators
 
@@ -31,8 +30,8 @@ class OrganiserSchema(SQLAlchemyAutoSchema):
         - Trim whitespace
         - Lowercase email
         
-    Post-load:
-        - Ensure email and phone number are unique in the database
+    Uniqueness:
+        - Email and phone number are unique (enforced by the database, reported by controllers.organiser_controller)
     """
     class Meta:
         model = Organiser
@@ -60,23 +59,6 @@ class OrganiserSchema(SQLAlchemyAutoSchema):
             if isinstance(phone, str):
                 data['phone_number'] = phone.strip()
         return data
-    
-    @post_load
-    def check_uniqueness(self, data, **kwargs):
-        if 'email' in data and data['email']:
-            query = db.session.query(Organiser).filter_by(email = data['email'])
-            if getattr(self, 'instance', None):
-                query = query.filter(Organiser.organiser_id != self.instance.organiser_id)
-            if query.first():
-                raise ValidationError({"email": ["Email already exists."]})
-
-        if 'phone_number' in data and data['phone_number']:
-            query = db.session.query(Organiser).filter_by(phone_number = data['phone_number'])
-            if getattr(self, 'instance', None):
-                query = query.filter(Organiser.organiser_id != self.instance.organiser_id)
-            if query.first():
-                raise ValidationError({"phone_number": ["Phone number already exists."]})
-        return data
 
 organiser_schema = OrganiserSchema()
 organisers_schema = OrganiserSchema(many = True)
\ No newline at end of file
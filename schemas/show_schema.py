@@ -5,13 +5,13 @@ normalization, and nested relationships. Used for input validation and output
 formatting in API endpoints and data processing.
 """
 
+from datetime import datetime
+
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from marshmallow import fields, post_dump, validate, validates_schema, ValidationError
-from sqlalchemy import Date, cast
 
-from init import db
 from models.show import Show
-from utils.constraints import DATE_DISPLAY_FORMAT, DATETIME_DISPLAY_FORMAT
+from utils.constraints import ShowStatus, DATETIME_DISPLAY_FORMAT
 
 class ShowSchema(SQLAlchemyAutoSchema):
     """Schema for Show model with nested event/venue, enum serialization,
@@ -29,16 +29,14 @@ class ShowSchema(SQLAlchemyAutoSchema):
 
     Validations:
         - show_status must be a valid enum
-        - date_time required and formatted
+        - date_time required, formatted and in the future
         - Event ID must refer to an existing ID
-        - Only one show per venue per day
         - Event ID and Venue ID positive integers
-        - Unique constraint:
+        - Unique constraint (enforced by the database, reported by controllers.show_controller):
             - Each venue can only have one show per day.
 
     Post-dump:
         - Add placeholder venue if none assigned ('Venue To Be Announced', 'TBA')
-        - Convert enum to string
     """
     class Meta:
         model = Show
@@ -50,22 +48,16 @@ class ShowSchema(SQLAlchemyAutoSchema):
     event = fields.Nested("EventSchema", dump_only = True, only = ("title",))
     venue = fields.Nested("VenueSchema", dump_only = True, only = ("name", "location"))
 
-    show_status = fields.Str(required = False, validate = validate.OneOf(['CONFIRMED', 'CANCELLED', 'POSTPONED', 'RESCHEDULED'], error = "Show status must be one of: CONFIRMED, CANCELLED, POSTPONED, RESCHEDULED."))
+    show_status = fields.Enum(ShowStatus, required = False, error_messages = {"unknown": "Show status must be one of: CONFIRMED, CANCELLED, POSTPONED, RESCHEDULED."}) # Dumps the member name directly
     date_time = fields.DateTime(required = True, format = DATETIME_DISPLAY_FORMAT)
     event_id = fields.Integer(required = True, validate = validate.Range(min = 1))
     venue_id = fields.Integer(allow_none = True, validate = validate.Range(min = 1))
 
     @validates_schema
-    def validate_unique_per_day_per_venue(self, data, **kwargs):
-        venue_id = data.get("venue_id")
+    def validate_future_date_time(self, data, **kwargs):
         date_time = data.get("date_time")
-        if not (venue_id and date_time):
-            return
-        query = db.session.query(Show).filter(Show.venue_id == venue_id, cast(Show.date_time, Date) == date_time.date())
-        if getattr(self, "instance", None) and getattr(self.instance, "show_id", None):
-            query = query.filter(Show.show_id != self.instance.show_id)
-        if query.first():
-            raise ValidationError({"venue_id": [f"Venue already has a show scheduled on {date_time.strftime(DATE_DISPLAY_FORMAT)}."]})
+        if date_time and date_time <= datetime.now():
+            raise ValidationError({"date_time": ["Shows must be scheduled for future dates and times."]})
 
     @post_dump
     def add_venue_placeholder(self, data, **kwargs):
@@ -73,14 +65,4 @@ class ShowSchema(SQLAlchemyAutoSchema):
             data['venue'] = {'name': 'Venue To Be Announced', 'location': 'TBA'}
         return data
 
-    @post_dump
-    def convert_enum_to_value(self, data, **kwargs):
-        if 'show_status' in data:
-            if hasattr(data['show_status'], 'value'):
-                data['show_status'] = data['show_status'].value
-            elif isinstance(data['show_status'], str) and 'ShowStatus.' in data['show_status']:
-                data['show_status'] = data['show_status'].split('.')[-1]
-        return data
-
-show_schema = ShowSchema()
-shows_schema = ShowSchema(many=True)
\ No newline at end of file
+show_schema = ShowSchema()
\ No newline at end of file
@@ -6,9 +6,8 @@ Used for input validation and output formatting in API endpoints.
 """
 
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, auto_field
-from marshmallow import fields, pre_load, post_load, ValidationError
+from marshmallow import fields, pre_load
 
-from init import db
 from models.ticket_holder import TicketHolder
 from utils.validators import email_validators, phone_validators, first_name_validators, last_name_validators
 
@@ -33,8 +32,8 @@ class TicketHolderSchema(SQLAlchemyAutoSchema):
         - Lowercase email
         - Proper case names
     
-    Post-load:
-        - Ensure email and phone number are unique in the database
+    Uniqueness:
+        - Email and phone number are unique (enforced by the database, reported by controllers.ticket_holder_controller)
     """
     class Meta:
         model = TicketHolder
@@ -66,23 +65,5 @@ class TicketHolderSchema(SQLAlchemyAutoSchema):
             if isinstance(phone, str):
                 data['phone_number'] = phone.strip()
         return data
-    
-    @post_load
-    def check_uniqueness(self, data, **kwargs):
-        if 'email' in data and data['email']:
-            query = db.session.query(TicketHolder).filter_by(email = data['email'])
-            if getattr(self, 'instance', None):
-                query = query.filter(TicketHolder.ticket_holder_id != self.instance.ticket_holder_id)
-            if query.first():
-                raise ValidationError({"email": ["Email already exists."]})
-
-        if 'phone_number' in data and data['phone_number']:
-            query = db.session.query(TicketHolder).filter_by(phone_number = data['phone_number'])
-            if getattr(self, 'instance', None):
-                query = query.filter(TicketHolder.ticket_holder_id != self.instance.ticket_holder_id)
-            if query.first():
-                raise ValidationError({"phone_number": ["Phone number already exists."]})
-        return data
 
-ticket_holder_schema = TicketHolderSchema()
-ticket_holders_schema = TicketHolderSchema(many = True)
\ No newline at end of file
+ticket_holder_schema = TicketHolderSchema()
\ No newline at end of file
@@ -6,9 +6,8 @@ formatting in API endpoints and data processing.
 """
 
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema, auto_field
-from marshmallow import fields, pre_load, post_load, validate, ValidationError
+from marshmallow import fields, pre_load, validate
 
-from init import db
 from models.venue import Venue
 from utils.validators import venue_name_validators, venue_location_validators
 
@@ -32,8 +31,8 @@ class VenueSchema(SQLAlchemyAutoSchema):
         - Trim whitespace
         - Proper-case name
         
-    Post-load:
-        - Ensure venue name is unique in the database
+    Uniqueness:
+        - Venue name is unique (enforced by the database, reported by controllers.venue_controller)
     """
     class Meta:
         model = Venue
@@ -58,16 +57,4 @@ class VenueSchema(SQLAlchemyAutoSchema):
                 data['location'] = location.strip()
         return data
 
-    @post_load
-    def check_uniqueness(self, data, **kwargs):
-        name = data.get('name')
-        if name:
-            query = db.session.query(Venue).filter_by(name = name)
-            if getattr(self, 'instance', None):
-                query = query.filter(Venue.venue_id != self.instance.venue_id)
-            if query.first():
-                raise ValidationError({"name": ["Venue name already exists."]})
-        return data
-
-venue_schema = VenueSchema()
-venues_schema = VenueSchema(many = True)
\ No newline at end of file
+venue_schema = VenueSchema()
\ No newline at end of file
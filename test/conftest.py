@@ -3,8 +3,12 @@ Pytest fixtures for creating a Flask test client with an in-memory SQLite databa
 Ensures each test runs with a fresh database and proper teardown after completion.
 """
 
+import os
+
 import pytest
 
+os.environ["DATABASE_URI"] = "sqlite:///:memory:" # Read when create_app binds the database, before any .env value
+
 from main import create_app
 from init import db
 
@@ -12,7 +16,6 @@ from init import db
 def client():
     app = create_app()
     app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///:memory:"
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
     with app.app_context():
@@ -0,0 +1,71 @@
+"""
+Unit tests for the batch retrieval endpoint in GigMate.
+
+Tests that found and missing paths each get their own status in one response,
+and that nested fields are eager loaded so the query count doesn't grow with the batch.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import event
+
+from init import db
+from models.booking import Booking, BookingStatus, Section
+from models.event import Event
+from models.organiser import Organiser
+from models.show import Show
+from models.ticket_holder import TicketHolder
+from models.venue import Venue
+
+
+def seed(count):
+    """Add `count` of each resource, every event with a show at its own venue and a booking for it."""
+    for i in range(1, count + 1):
+        organiser = Organiser(full_name=f'Organiser {i}', email=f'org{i}@email.com', phone_number=f'+6140000000{i}')
+        venue = Venue(name=f'Venue {i}', location='Melbourne', capacity=100)
+        ev = Event(title=f'Event {i}', description='d', duration_hours=2.0, organiser=organiser)
+        show = Show(date_time=datetime(2030, 1, i, 19, 0), event=ev, venue=venue)
+        th = TicketHolder(first_name='Tess', last_name='Holder', email=f'th{i}@email.com', phone_number=f'+6141000000{i}')
+        booking = Booking(booking_status=BookingStatus.CONFIRMED, section=Section.SEATING, seat_number='A1', ticket_holder=th, show=show)
+        db.session.add_all([organiser, venue, ev, show, th, booking])
+    db.session.commit()
+
+def count_batch_queries(client, paths):
+    """POST the paths to /batch and return the number of SQL statements it ran."""
+    statements = []
+    def record(*args):
+        statements.append(args[2])
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        response = client.post('/batch/', json=paths)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    assert all(result['status'] == 200 for result in response.get_json())
+    return len(statements)
+
+def test_batch_mixed_found_and_missing(client):
+    """POST /batch
+    Test a batch mixing existing IDs, missing IDs and an unknown resource.
+    Return: 200 with a result per path, in request order, each with its own status.
+    """
+    seed(1)
+    response = client.post('/batch/', json=['/events/1', '/events/999', '/shows/1', '/nope/1'])
+    assert response.status_code == 200
+    results = response.get_json()
+    assert [result['path'] for result in results] == ['/events/1', '/events/999', '/shows/1', '/nope/1']
+    assert [result['status'] for result in results] == [200, 404, 200, 404]
+    assert results[0]['body']['title'] == 'Event 1'
+    assert results[1]['body'] == {'message': "Event with id 999 doesn't exist."}
+    assert results[3]['body'] == {'message': 'Resource not found. Please check the URL.'}
+
+def test_batch_query_count_fixed(client):
+    """POST /batch
+    Test that the number of queries doesn't grow with the number of IDs per resource.
+    Return: the same query count for 1 and 5 IDs of every resource.
+    """
+    seed(5)
+    resources = ['bookings', 'events', 'organisers', 'shows', 'ticket_holders', 'venues']
+    one_each = [f'/{resource}/1' for resource in resources]
+    five_each = [f'/{resource}/{i}' for resource in resources for i in range(1, 6)]
+    assert count_batch_queries(client, five_each) == count_batch_queries(client, one_each)
\ No newline at end of file
@@ -6,6 +6,8 @@ while allowing the same seat to be booked across different shows.
 Uses SQLAlchemy in-memory database session for isolated testing.
 """
 
+from datetime import datetime
+
 import pytest
 from init import db
 from models.ticket_holder import TicketHolder
@@ -16,26 +18,26 @@ from models.booking import Booking, BookingStatus, Section
 
 def test_seat_uniqueness_per_show(client):
     """
-    Test that a seat can only be booked once per show.
+    Test that a seat can only be booked once per show while a booking for it is confirmed.
 
     - Adds a ticket holder and an event.
     - Creates two shows for that event.
     - Attempts to book the same seat twice for the same show (should fail).
+    - Cancels the first booking and books the seat for another ticket holder (should succeed).
     - Books the same seat for a different show (should succeed).
     """
     th = TicketHolder(first_name='A', last_name='B', email='a@b.com', phone_number='+11111111111')
-    db.session.add(th)
     ev = Event(title='E1', description='d', duration_hours=1.0)
-    db.session.add(ev)
-    db.session.commit()
+    db.session.add_all([th, ev])
+    db.session.flush() # Assign IDs without a commit per step
 
     # Create two shows
-    show1 = Show(date_time='2025-11-01 19:00:00', event_id=ev.event_id)
-    show2 = Show(date_time='2025-11-02 19:00:00', event_id=ev.event_id)
+    show1 = Show(date_time=datetime(2025, 11, 1, 19, 0), event_id=ev.event_id)
+    show2 = Show(date_time=datetime(2025, 11, 2, 19, 0), event_id=ev.event_id)
     db.session.add_all([show1, show2])
-    db.session.commit()
+    db.session.flush()
 
-    # Booking seat A1 on show1 should succeed
+    # Booking seat A1 on show1 should succeed, seed rows committed once so the rollback below keeps them
     b1 = Booking(booking_status=BookingStatus.CONFIRMED, section=Section.SEATING, seat_number='A1', ticket_holder_id=th.ticket_holder_id, show_id=show1.show_id)
     db.session.add(b1)
     db.session.commit()
@@ -47,10 +49,40 @@ def test_seat_uniqueness_per_show(client):
         db.session.commit()
     db.session.rollback()
 
+    # Once b1 is cancelled the seat is free again for another ticket holder
+    th2 = TicketHolder(first_name='C', last_name='D', email='c@d.com', phone_number='+12222222222')
+    db.session.add(th2)
+    b1.booking_status = BookingStatus.CANCELLED
+    db.session.flush()
+    b4 = Booking(booking_status=BookingStatus.CONFIRMED, section=Section.SEATING, seat_number='A1', ticket_holder_id=th2.ticket_holder_id, show_id=show1.show_id)
+    db.session.add(b4)
+    db.session.commit()
+    assert b4.booking_id is not None
+
     # Booking seat A1 on different show should succeed
     b3 = Booking(booking_status=BookingStatus.CONFIRMED, section=Section.SEATING, seat_number='A1', ticket_holder_id=th.ticket_holder_id, show_id=show2.show_id)
     db.session.add(b3)
     db.session.commit()
 
     # Verify booking was successful
-    assert b3.booking_id is not None
\ No newline at end of file
+    assert b3.booking_id is not None
+
+def test_bulk_create_duplicate_seat(client):
+    """POST /bookings/bulk
+    Test a bulk create where two ticket holders book the same seat for the same show.
+    Return: 400 with the seat already booked error, and no bookings created.
+    """
+    th1 = TicketHolder(first_name='A', last_name='B', email='a@b.com', phone_number='+11111111111')
+    th2 = TicketHolder(first_name='C', last_name='D', email='c@d.com', phone_number='+12222222222')
+    ev = Event(title='E1', description='d', duration_hours=1.0)
+    show = Show(date_time=datetime(2030, 11, 1, 19, 0), event=ev)
+    db.session.add_all([th1, th2, ev, show])
+    db.session.commit()
+
+    response = client.post('/bookings/bulk', json=[
+        {"section": "SEATING", "seat_number": "A1", "ticket_holder_id": th1.ticket_holder_id, "show_id": show.show_id},
+        {"section": "SEATING", "seat_number": "A1", "ticket_holder_id": th2.ticket_holder_id, "show_id": show.show_id}
+    ])
+    assert response.status_code == 400
+    assert response.get_json()['error']['message'] == {"seat_number": ["This seat is already booked for this show."]}
+    assert db.session.scalar(db.select(db.func.count(Booking.booking_id))) == 0
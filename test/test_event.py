@@ -0,0 +1,17 @@
+"""
+Unit tests for the Event API endpoints in GigMate.
+
+Tests that an event repeating another's title and description is reported as a
+field-level validation error.
+"""
+
+def test_create_event_duplicate_content(client):
+    """POST /events
+    Test creating an event with the same title and description as an existing one.
+    Return: 400 with the field-level title error.
+    """
+    event = {"title": "Big Gig", "description": "A gig", "duration_hours": 2}
+    assert client.post('/events/', json = event).status_code == 201
+    response = client.post('/events/', json = {**event, "duration_hours": 3})
+    assert response.status_code == 400
+    assert response.get_json()['error']['message'] == {"title": ["Event with this title and description already exists."]}
\ No newline at end of file
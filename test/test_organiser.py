@@ -0,0 +1,28 @@
+"""
+Unit tests for the Organiser API endpoints in GigMate.
+
+Tests that duplicate emails and phone numbers are reported as field-level
+validation errors rather than database errors.
+"""
+
+import pytest
+
+ORGANISER = {
+    "full_name": "Jane Doe",
+    "email": "jane@email.com",
+    "phone_number": "0412345678"
+}
+
+@pytest.mark.parametrize("changed, field, message", [
+    ({"phone_number": "0412345679"}, "email", "Email already exists."),
+    ({"email": "jane2@email.com"}, "phone_number", "Phone number already exists.")
+])
+def test_create_organiser_duplicate(client, changed, field, message):
+    """POST /organisers
+    Test creating an organiser that reuses another organiser's email or phone number.
+    Return: 400 with the field-level error for the duplicated field.
+    """
+    assert client.post('/organisers/', json = ORGANISER).status_code == 201
+    response = client.post('/organisers/', json = {**ORGANISER, **changed})
+    assert response.status_code == 400
+    assert response.get_json()['error']['message'] == {field: [message]}
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Unit tests for the Show API endpoints in GigMate.
+
+Tests ETag revalidation on /shows/<id> and the one show per venue per day rule
+using the Flask test client.
+"""
+
+from datetime import datetime
+
+from init import db
+from models.event import Event
+from models.show import Show
+from models.venue import Venue
+
+def test_get_show_not_modified(client):
+    """GET /shows/<id>
+    Test a conditional GET sending back the ETag from the first response.
+    Return: 304 with no body, and 200 with the body again once the ETag no longer matches.
+    """
+    ev = Event(title='E1', description='d', duration_hours=1.0)
+    show = Show(date_time=datetime(2030, 11, 1, 19, 0), event=ev)
+    db.session.add_all([ev, show])
+    db.session.commit()
+
+    response = client.get(f'/shows/{show.show_id}')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag
+
+    response = client.get(f'/shows/{show.show_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    response = client.get(f'/shows/{show.show_id}', headers={'If-None-Match': '"stale"'})
+    assert response.status_code == 200
+    assert response.headers['ETag'] == etag
+    assert response.get_json()['show_id'] == show.show_id
+
+def test_create_show_same_venue_same_day(client):
+    """POST /shows
+    Test scheduling a second show at a venue on a day it already has one.
+    Return: 400 with the field-level venue_id error naming the day.
+    """
+    ev = Event(title='E1', description='d', duration_hours=1.0)
+    venue = Venue(name='The Forum', location='154 Flinders St, Melbourne VIC 3000', capacity=2000)
+    db.session.add_all([ev, venue])
+    db.session.commit()
+
+    show = {"date_time": "27-11-2030 | 08:30 PM", "event_id": ev.event_id, "venue_id": venue.venue_id}
+    assert client.post('/shows/', json=show).status_code == 201
+    response = client.post('/shows/', json={**show, "date_time": "27-11-2030 | 10:30 PM"})
+    assert response.status_code == 400
+    assert response.get_json()['error']['message'] == {"venue_id": ["Venue already has a show scheduled on 27-11-2030."]}
\ No newline at end of file
@@ -11,10 +11,10 @@ from models.ticket_holder import TicketHolder
 def test_get_ticket_holders(client):
     """GET /ticket_holders
     Test retrieving all ticket holders when the database is empty.
-    Return: 404 with a friendly message.
+    Return: 200 with a friendly message.
     """
     response = client.get('/ticket_holders/')
-    assert response.status_code == 404
+    assert response.status_code == 200
     data = response.get_json()
     assert data.get('message') == 'No ticket holders found.'
 
@@ -54,4 +54,20 @@ def test_update_ticket_holder_success(client):
     response = client.patch(f"/ticket_holders/{ticket_holder_id}", json = update_data)
     assert response.status_code == 200
     updated_ticket_holder = response.get_json()
-    assert updated_ticket_holder["first_name"] == "Passed"
\ No newline at end of file
+    assert updated_ticket_holder["first_name"] == "Passed"
+
+def test_create_ticket_holder_duplicate_email(client):
+    """POST /ticket_holders
+    Test creating a ticket holder with an email that is already taken.
+    Return: 400 with the field-level email error.
+    """
+    ticket_holder = {
+        "first_name": "John",
+        "last_name": "Smith",
+        "email": "john@email.com",
+        "phone_number": "0324555444"
+    }
+    assert client.post('/ticket_holders/', json = ticket_holder).status_code == 201
+    response = client.post('/ticket_holders/', json = {**ticket_holder, "phone_number": "0324555445"})
+    assert response.status_code == 400
+    assert response.get_json()['error']['message'] == {"email": ["Email already exists."]}
\ No newline at end of file
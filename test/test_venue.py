@@ -0,0 +1,16 @@
+"""
+Unit tests for the Venue API endpoints in GigMate.
+
+Tests that a duplicate venue name is reported as a field-level validation error.
+"""
+
+def test_create_venue_duplicate_name(client):
+    """POST /venues
+    Test creating a venue with a name that is already taken.
+    Return: 400 with the field-level name error.
+    """
+    venue = {"name": "The Forum", "location": "154 Flinders St, Melbourne VIC 3000", "capacity": 2000}
+    assert client.post('/venues/', json = venue).status_code == 201
+    response = client.post('/venues/', json = {**venue, "capacity": 500})
+    assert response.status_code == 400
+    assert response.get_json()['error']['message'] == {"name": ["Venue name already exists."]}
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Utility module for caching GET responses per resource.
+
+Cache keys carry a per-resource version number, so any write can invalidate
+every cached page of a resource (all query strings) by bumping one counter
+instead of tracking and deleting individual keys.
+"""
+
+from urllib.parse import urlencode
+
+from flask import request
+from sqlalchemy import func
+
+from init import db, cache
+
+def _version(resource):
+    return cache.get(f"{resource}:version") or 0
+
+def cache_key_for(resource):
+    """Build a make_cache_key callable for cached views of a resource.
+    Args: resource: Name of the resource the view serves (e.g. "events").
+    Returns: Callable producing a key from the version, path and sorted query args.
+    """
+    def make_cache_key(*args, **kwargs):
+        query = urlencode(sorted(request.args.items(multi = True)))
+        return f"{resource}:v{_version(resource)}:{request.path}?{query}"
+    return make_cache_key
+
+def cached_count(resource, column, timeout = 60):
+    """Return COUNT(column), cached until the resource is next invalidated.
+    Args: resource: Name of the resource the count belongs to (e.g. "bookings").
+          column: Column to count, usually the primary key.
+          timeout: Seconds to keep the count cached.
+    Returns: The row count as an int.
+    """
+    key = f"{resource}:v{_version(resource)}:count"
+    total = cache.get(key)
+    if total is None:
+        total = db.session.scalar(db.select(func.count(column)))
+        cache.set(key, total, timeout = timeout)
+    return total
+
+def invalidate(*resources):
+    """Invalidate all cached responses for the given resources."""
+    for resource in resources:
+        cache.cache.inc(f"{resource}:version")
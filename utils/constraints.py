@@ -45,9 +45,12 @@ venue_name_regex = r"^[A-Za-z0-9]([A-Za-z0-9\s\-''\.&]*[A-Za-z0-9])?$"
 venue_name_validation_error = "Venue name can only contain letters, numbers, spaces, hyphens, apostrophes, and ampersands."
 
 # Venue location regex for Google Maps style validation - optional street number, location name, suburb, state, postcode
-venue_location_regex = r"^([0-9]+[A-Za-z]?\s+)?[A-Za-z\s\-''\.]+,\s*[A-Za-z\s\-''\.]+\s+[A-Z]{2,3}\s+[0-9]{4}$"
+# Extra spaces are matched by the name classes (which include \s), not by separate \s+ / \s* runs beside them,
+# so long runs of spaces can't be split many ways and backtrack catastrophically (same strings accepted as before)
+venue_location_regex = r"^([0-9]+[A-Za-z]?\s)?[A-Za-z\s\-''\.]+,[A-Za-z\s\-''\.]+\s[A-Z]{2,3}\s+[0-9]{4}$"
 venue_location_validation_error = "Location must follow Google Maps style exactly: 'Number (optional) Location Name, Suburb/City STATE POSTCODE'"
 
 # Seat number regex: e.g., A1, B12, AA10 (1-2 letters, 1-2 digits)
-seat_number_regex = r'^[A-Z]{1,2}[0-9]{1,2}$'
+# \Z, not $: seat_number isn't stripped on load and $ would also accept a trailing newline ('A1\n')
+seat_number_regex = r'^[A-Z]{1,2}[0-9]{1,2}\Z'
 seat_number_validation_error = "Seat number must be 1-2 uppercase letters followed by 1-2 digits (e.g., 'A1', 'B12', 'AA10')."
\ No newline at end of file
@@ -63,7 +63,7 @@ def error_handlers(app):
     @app.errorhandler(IntegrityError)
     def handle_integrity_error(err):
         if hasattr(err, "orig") and err.orig:
-            code = err.orig.pgcode
+            code = getattr(err.orig, "pgcode", None) # None for non-psycopg2 drivers, falls through to the generic message
             if code == errorcodes.NOT_NULL_VIOLATION:
                 return error_response(f"Missing required field: {err.orig.diag.column_name}.", 409, "IntegrityError")
             if code == errorcodes.UNIQUE_VIOLATION:
@@ -78,7 +78,7 @@ def error_handlers(app):
                     "ForeignKeyViolation"
                 )
             if code == errorcodes.CHECK_VIOLATION:
-                if "check_future_show" in str(err.orig):
+                if err.orig.diag.constraint_name == "check_future_show": # Databases created before ShowSchema took over this rule still have the CHECK
                     return error_response("Shows must be scheduled for future dates and times.", 400, "CheckViolation")
                 return error_response(err.orig.diag.message_detail, 409, "CheckViolation")
             return error_response("Unknown integrity error occurred.", 409, "IntegrityError")
@@ -0,0 +1,20 @@
+"""Utility module for ETag revalidation of GET responses.
+
+Successful GET responses carry a strong ETag hashed from the body. Clients that
+send it back in If-None-Match get an empty 304 Not Modified instead of the full
+JSON payload.
+"""
+
+from flask import request
+
+def register_etags(app):
+    """Attach ETags to GET responses when the ETAGS config flag is on."""
+
+    @app.after_request
+    def add_etag(response):
+        if not app.config.get("ETAGS") or request.method != "GET" or response.status_code != 200 or response.is_streamed:
+            return response
+        response.add_etag() # Hash of the body, costs one pass over the bytes
+        response.cache_control.private = True
+        response.cache_control.must_revalidate = True
+        return response.make_conditional(request) # 304 with no body when If-None-Match matches
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Utility module for reporting unique constraint violations as validation errors.
+
+Uniqueness is enforced by the unique constraints on each model instead of a
+SELECT before every write, so the common create/update path is a single
+statement and two concurrent requests can't both pass a check and insert a
+duplicate. Known constraint names are mapped back to field-level messages.
+Every unique constraint and index is named in its model, so the name can be
+resolved on both Postgres and SQLite (see violated_constraint).
+"""
+
+import re
+
+from marshmallow import ValidationError
+from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
+
+from init import db
+
+SQLITE_UNIQUE = re.compile(r"UNIQUE constraint failed: (?:index '(\w+)'|(.+))")
+
+def violated_constraint(err):
+    """Name of the unique constraint or index an IntegrityError reports, or None.
+    Postgres gives the name in diag.constraint_name. SQLite names expression indexes
+    but lists the columns for the rest (e.g. "UNIQUE constraint failed: venues.name"),
+    so those are looked up by their columns in the metadata. User-supplied values
+    in the error message are never matched against.
+    """
+    diag = getattr(err.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+    match = SQLITE_UNIQUE.fullmatch(str(err.orig))
+    if not match:
+        return None
+    if match.group(1):
+        return match.group(1)
+    for table in db.metadata.tables.values():
+        for item in (*table.constraints, *table.indexes):
+            if isinstance(item, UniqueConstraint) or (isinstance(item, Index) and item.unique):
+                if ", ".join(f"{table.name}.{column.name}" for column in item.columns) == match.group(2):
+                    return item.name
+    return None
+
+def commit_unique(constraint_errors):
+    """Commit the session, reporting known unique violations as validation errors.
+    Args: constraint_errors: Dict of constraint name -> field error messages.
+    Raises: ValidationError if a listed constraint was violated; any other
+            IntegrityError is re-raised for utils.error_handlers.
+    """
+    try:
+        db.session.commit()
+    except IntegrityError as err:
+        db.session.rollback()
+        constraint = violated_constraint(err)
+        if constraint in constraint_errors:
+            raise ValidationError(constraint_errors[constraint]) from err
+        raise
\ No newline at end of file
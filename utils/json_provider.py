@@ -0,0 +1,41 @@
+"""Flask JSON provider backed by orjson.
+
+Replaces the stdlib json encoder used by jsonify and dict/list responses with
+orjson, which serializes in C. Key sorting and pretty-printing honour the same
+settings as Flask's DefaultJSONProvider.
+
+One difference: orjson encodes datetime, date and time natively as ISO 8601
+strings ("2025-11-27T20:30:00") before `default` is reached, where Flask's
+provider gives an HTTP date ("Thu, 27 Nov 2025 20:30:00 GMT"). Responses are
+unaffected because the schemas dump dates as formatted strings. UUIDs and
+dataclasses come out the same, and other unsupported types (e.g. Decimal) fall
+back to Flask's default conversion.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson."""
+
+    def _options(self, pretty = False):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default = self.default, option = self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            orjson.dumps(obj, default = self.default, option = self._options(pretty)) + b"\n", # Trailing newline like jsonify
+            mimetype = self.mimetype
+        )
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Utility module for SQLAlchemy loader options shared by list endpoints.
+
+Collection routes declare the relationships their schemas serialize up front,
+so a whole page is loaded in a fixed number of queries. In debug mode any other
+relationship access raises instead of silently issuing one query per row (N+1).
+"""
+
+from flask import current_app
+from sqlalchemy.orm import raiseload
+
+def list_load_options(*loaders):
+    """Return loader options for a collection query.
+    Args: loaders: Eager loader options (e.g. selectinload) the schema needs.
+    Returns: Tuple of options, with raiseload("*") appended when DEBUG is on.
+    """
+    if current_app.debug:
+        return (*loaders, raiseload("*")) # Fail loudly on unplanned lazy loads
+    return loaders
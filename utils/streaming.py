@@ -0,0 +1,32 @@
+"""Utility module for streaming JSON list responses.
+
+Rows are fetched in batches with yield_per and each one is dumped and written
+out as it arrives, so memory stays flat however large the table gets instead
+of holding every row, every dumped dict and the whole JSON body at once.
+"""
+
+from flask import current_app, stream_with_context
+
+from init import db
+
+YIELD_PER = 500 # Rows fetched per round trip
+
+def stream_list(stmt, schema, empty_message):
+    """Stream the rows of a select as a JSON array.
+    Args: stmt: Select statement for the rows.
+          schema: Single-object schema used to dump each row.
+          empty_message: Message returned when there are no rows.
+    Returns: Streamed JSON array response, or the empty message with 200.
+    """
+    rows = iter(db.session.scalars(stmt.execution_options(yield_per = YIELD_PER)))
+    first = next(rows, None)
+    if first is None:
+        return {"message": empty_message}, 200
+
+    def generate():
+        yield "[" + current_app.json.dumps(schema.dump(first))
+        for row in rows:
+            yield "," + current_app.json.dumps(schema.dump(row))
+        yield "]\n"
+
+    return current_app.response_class(stream_with_context(generate()), mimetype = "application/json"), 200
\ No newline at end of file
@@ -26,19 +26,21 @@ phone_validators = [
 ]
 
 # ========== Name validation (length + regex) ==========
+name_format_validator = validate.Regexp(name_regex, error = name_validation_error) # Stateless, shared by all three name fields
+
 first_name_validators = [
     validate.Length(min = 1, max = 20, error = "First name must be 1-20 characters"), 
-    validate.Regexp(name_regex, error = name_validation_error)
+    name_format_validator
 ]
 
 last_name_validators = [
     validate.Length(min = 1, max = 30, error = "Last name must be 1-30 characters"), 
-    validate.Regexp(name_regex, error = name_validation_error)
+    name_format_validator
 ]
 
 full_name_validators = [
     validate.Length(min = 2, max = 50, error = "Full name must be 2-50 characters"), 
-    validate.Regexp(name_regex, error = name_validation_error)
+    name_format_validator
 ]
 
 # ========== Venue name and location validation ==========